@@ -4,8 +4,8 @@ import os, re
 import time
 import subprocess
 import humanize
-from tqdm import tqdm
 from urllib.parse import urlparse
+from log import logger as lg
 
 # Set the download directory (change this easily)
 dldir = "downloads"
@@ -79,7 +79,7 @@ async def get_file_info(url):
 async def download_file(url, msg, filename=None, chunk_size=1024 * 1024):
     file_info = await get_file_info(url)
     if "error" in file_info:
-        print(f"Error: {file_info['error']}")
+        lg.error(f"Error: {file_info['error']}")
         await msg.edit_text(f"Err getting file data: {file_info['error']}")
         return {"error":file_info['error']}
 
@@ -93,7 +93,7 @@ async def download_file(url, msg, filename=None, chunk_size=1024 * 1024):
         try:
             async with session.get(url) as response:
                 if response.status != 200:
-                    print(f"Error: Unable to download file, status {response.status}")
+                    lg.error(f"Error: Unable to download file, status {response.status}")
                     await msg.edit_text(f"Error: Unable to download file, status {response.status}")
                     return
                 
@@ -103,7 +103,7 @@ async def download_file(url, msg, filename=None, chunk_size=1024 * 1024):
 
                     # If file size is unknown, download normally
                     if not file_size:
-                        print(f"Downloading {filename} (Unknown size)...")
+                        lg.info(f"Downloading {filename} (Unknown size)...")
                         await msg.edit_text(f"Downloading {filename} (Unknown size)")
                         async for chunk in response.content.iter_chunked(chunk_size):
                             f.write(chunk)
@@ -114,40 +114,39 @@ async def download_file(url, msg, filename=None, chunk_size=1024 * 1024):
                             speed = downloaded / elapsed_time if elapsed_time > 0 else 0
                              
                             await print_progress(filename=filename, downloaded=downloaded, total_size=None, speed=speed, eta=None, st=start_time, msg=msg)
-                        print(f"\nDownload complete: {file_path}")
+                        lg.info(f"Download complete: {file_path}")
                         await msg.edit_text(f"Download complete: {file_path}")
                         return
                     
                     # If file size is known, show progress
-                    with tqdm(total=file_size, unit="B", unit_scale=True, desc=filename) as progress:
-                        async for chunk in response.content.iter_chunked(chunk_size):
-                            if not chunk:
-                                break
-                            f.write(chunk)
-                            downloaded += len(chunk)
-                            
-                            # Calculate percentage, speed, and ETA
-                            elapsed_time = time.time() - start_time
-                            speed = downloaded / elapsed_time if elapsed_time > 0 else 0
-                            eta = (file_size - downloaded) / speed if speed > 0 else 0
-
-                            # Print progress
-                            progress.update(len(chunk))
-                            await print_progress(filename, downloaded, file_size, speed, eta, st=start_time, msg=msg)
+                    lg.info(f"Downloading {filename} ({format_size(file_size)})...")
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                        downloaded += len(chunk)
+                        
+                        # Calculate percentage, speed, and ETA
+                        elapsed_time = time.time() - start_time
+                        speed = downloaded / elapsed_time if elapsed_time > 0 else 0
+                        eta = (file_size - downloaded) / speed if speed > 0 else 0
+
+                        # Print progress
+                        await print_progress(filename, downloaded, file_size, speed, eta, st=start_time, msg=msg)
 
         except Exception as e:
-            print(f"Download failed: {str(e)}")
+            lg.error(f"Download failed: {str(e)}")
             await msg.edit_text(f"Download failed: {str(e)}")
             return {"error": f"ERR on download : {str(e)}"}
 
-    print(f"\nDownload complete: {file_path}")
+    lg.info(f"Download complete: {file_path}")
     await msg.edit_text(f"Download complete: {file_path}")
     return {"ok":f"{file_path}"}
 
 
 async def download_m3u8(url, msg, filename):
     file_path = os.path.join(dldir, filename)
-    print(f"Downloading M3U8 stream: {url} -> {file_path}")
+    lg.info(f"Downloading M3U8 stream: {url} -> {file_path}")
     await msg.edit_text(f"Downloading M3U8 stream: {url} -> {file_path}")
 
     command = [
@@ -203,20 +202,23 @@ async def download_m3u8(url, msg, filename):
         process.wait()
 
         if process.returncode != 0:
+            lg.error(f"FFmpeg failed to download M3U8 stream: {url}")
             await msg.edit_text(f"❌ FFmpeg failed to download M3U8 stream.")
             return {"error": "ERR on ffmpeg download m3u8."}
 
+        lg.info(f"M3U8 Download complete: {file_path}")
         await msg.edit_text(f"✅ M3U8 Download complete: `{filename}`")
         return {"ok": file_path}
 
     except Exception as e:
+        lg.error(f"Error downloading M3U8: {str(e)}")
         await msg.edit_text(f"❌ Error downloading M3U8: {str(e)}")
         return {"error": f"ERR on download m3u8: {str(e)}"}
 
 #handled m3u8 dl
 async def download_m3u8_2(url, msg, filename):
     filename = os.path.join(dldir, filename)  # Save in the specified directory
-    print(f"Downloading M3U8 stream: {url} -> {filename}")
+    lg.info(f"Downloading M3U8 stream: {url} -> {filename}")
     await msg.edit_text(f"Downloading M3U8 stream: {url} -> {filename}")
     file_path = os.path.join(dldir, filename)
 
@@ -245,17 +247,17 @@ async def download_m3u8_2(url, msg, filename):
         await process.wait()
 
         if process.returncode != 0:
-            print(f"Error: FFmpeg failed to download M3U8 stream.")
+            lg.error(f"Error: FFmpeg failed to download M3U8 stream.")
             await msg.edit_text(f"Error: FFmpeg failed to download M3U8 stream.")
             return {"error": f"ERR on ffmpeg download m3u8."}
 
         else:
-            print(f"\nM3U8 Download complete: {filename}")
+            lg.info(f"M3U8 Download complete: {filename}")
             await msg.edit_text(f"\nM3U8 Download complete: {filename}")
             return {"ok":f"{file_path}"}
     
     except Exception as e:
-        print(f"Error downloading M3U8: {str(e)}")
+        lg.error(f"Error downloading M3U8: {str(e)}")
         await msg.edit_text(f"Error downloading M3U8: {str(e)}")
         return {"error": f"ERR on download m3u8: {str(e)}"}
 
@@ -271,7 +273,7 @@ async def print_progress(filename, downloaded, total_size, speed, eta, st, msg=N
     size_done = format_size(downloaded)
     total_size_str = format_size(total_size) if total_size else "Unknown"
 
-    print(f"\r{filename}: {size_done}/{total_size_str} ({percent_done}) at {speed_str}, ETA: {eta_str}", end="", flush=True)
+    lg.debug(f"{filename}: {size_done}/{total_size_str} ({percent_done}) at {speed_str}, ETA: {eta_str}")
     if msg:
         if last_t == 0 or time.time() - last_t >= 10:
             new_msg = f"**Downloading...**\n\nName : {filename}\nDone : {size_done}/{total_size_str}\nP : {percent_done}\nSpeed : {speed_str}\nETA: {eta_str}"
@@ -285,7 +287,7 @@ async def dl(url, msg, custom_filename=None):
     file_info = await get_file_info(url)
 
     if "error" in file_info:
-        print(f"Error: {file_info['error']}")
+        lg.error(f"Error: {file_info['error']}")
         await msg.edit_text(f"Err getting file data: {file_info['error']}")
         return {"error": file_info["error"]}
 
@@ -305,6 +307,6 @@ async def dl(url, msg, custom_filename=None):
             return {"error": dlf['error']}
     
     except Exception as e:
-        print(f"Error during download: {str(e)}")
+        lg.error(f"Error during download: {str(e)}")
         await msg.edit_text(f"Error: {str(e)}")
         return {"error": str(e)}
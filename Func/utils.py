@@ -1,6 +1,5 @@
 import os, re
 import time
-import requests
 import subprocess
 from pyrogram import Client, filters
 from pyrogram.types import Message
@@ -1,8 +1,12 @@
-import os
 import time
-from pyrogram import Client, filters
+t0 = time.perf_counter()
+import os
+from importlib import import_module
+from pathlib import Path
+from pyrogram import Client, filters, idle
 from pyrogram.types import Message
 from config import Config
+from log import logger as lg
 
 # Environment variables
 API_ID = Config.API_ID
@@ -14,5 +18,37 @@ OWNER = Config.OWNER
 plugins = dict(root="plugins")
 app = Client("rvx_tguper_bot", api_id=API_ID, api_hash=API_HASH, bot_token=BOT_TOKEN,plugins=plugins)
 
+async def main():
+    import server
+    server.mark("imports", time.perf_counter() - t0)
+
+    # Serve health/metrics/status from this process instead of a separate gunicorn.
+    # Started before login so health checks pass while Telegram is slow to answer.
+    runner = None
+    if Config.WEB_INLINE:
+        t1 = time.perf_counter()
+        runner = await server.start_server(port=Config.PORT)
+        server.mark("web_start", time.perf_counter() - t1)
+
+    # Import the plugin modules up front so their cost is reported on its own;
+    # app.start() then registers them straight from sys.modules
+    t1 = time.perf_counter()
+    for path in sorted(Path(plugins["root"]).rglob("*.py")):
+        import_module(".".join(path.parent.parts + (path.stem,)))
+    server.mark("plugins", time.perf_counter() - t1)
+
+    # Connects and authorizes with the bot token
+    t1 = time.perf_counter()
+    await app.start()
+    server.mark("connect", time.perf_counter() - t1)
+
+    server.report_startup()
+    await idle()
+
+    if runner:
+        await runner.cleanup()
+    await app.stop()
+    lg.info("Bot stopped.")
+
 # Run the bot
-app.run()
+app.run(main())
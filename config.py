@@ -11,4 +11,20 @@ class Config(object):
   
   OWNER =os.getenv("owner","1399186514")
 
+  LOG_FILE = os.getenv("logfile","login_activity.log")
+
+  # Applies to the log file, the console and the /logs ring
+  LOG_LEVEL = os.getenv("loglevel","INFO").upper()
+
+  LOG_MAX_BYTES = int(os.getenv("logmaxbytes",5 * 1024 * 1024))
+
+  LOG_BACKUPS = int(os.getenv("logbackups",3))
+
+  LOG_RING_SIZE = int(os.getenv("logring",200))
+
+  # Run the health/metrics/status server inside the bot process (set to 0 to use gunicorn app:app, see requirements-flask.txt)
+  WEB_INLINE = os.getenv("webinline","1").lower() in ("1","true","yes")
+
+  PORT = int(os.getenv("PORT",8000))
+
   #PW =int(os.getenv("spw"))
@@ -0,0 +1,372 @@
+"""In-process load test for the plugin handlers.
+
+Loads the ``plugins`` package against a fake pyrogram client, points N
+simulated users at a local origin server while the owner adds and removes
+authorized users, and reports per-job latency, edit-call rate, peak open
+files/sockets and correctness checks.
+
+    python loadtest.py --users 20 --size 4194304 --rate 2097152
+"""
+import argparse
+import asyncio
+import math
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from importlib import import_module
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent
+CHUNK = 64 * 1024
+JOB_RE = re.compile(r"job-\d{4}")
+OWNER_ID = 999
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Simulate concurrent users against the plugin handlers.")
+    p.add_argument("--users", type=int, default=10, help="number of simulated users (one link each)")
+    p.add_argument("--ramp", type=float, default=1.0, help="seconds over which users arrive")
+    p.add_argument("--size", type=int, default=4 * 1024 * 1024, help="bytes served per file")
+    p.add_argument("--rate", type=int, default=2 * 1024 * 1024, help="origin/upload bytes per second per connection")
+    p.add_argument("--workers", type=int, default=None, help="concurrent handler workers (default: pyrogram's)")
+    p.add_argument("--flood-burst", type=int, default=5, help="edits/replies allowed per chat before FloodWait")
+    p.add_argument("--flood-rate", type=float, default=1.0, help="edits/replies per second refilled per chat (0 disables FloodWait)")
+    p.add_argument("--sleep-threshold", type=int, default=None,
+                   help="FloodWaits up to this many seconds are slept through, like Client.sleep_threshold (default: pyrogram's)")
+    p.add_argument("--progress-window", type=float, default=10.0,
+                   help="a download running longer than this must get at least one progress edit")
+    p.add_argument("--auth-ops", type=int, default=None, help="owner /addauth + /removeauth pairs sent during the run (default: --users)")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--verbose", action="store_true", help="keep the bot's console logging")
+    return p.parse_args()
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    k = (len(values) - 1) * pct / 100
+    lo, hi = math.floor(k), math.ceil(k)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+# Local origin serving throttled dummy files
+async def start_origin(size, rate):
+    from aiohttp import web
+
+    async def head(request):
+        return web.Response(headers={"Content-Length": str(size), "Content-Type": "application/octet-stream"})
+
+    async def get(request):
+        resp = web.StreamResponse(headers={"Content-Type": "application/octet-stream"})
+        resp.content_length = size
+        await resp.prepare(request)
+        sent = 0
+        try:
+            while sent < size:
+                n = min(CHUNK, size - sent)
+                await resp.write(b"\0" * n)
+                sent += n
+                await asyncio.sleep(n / rate)
+            await resp.write_eof()
+        except ConnectionResetError:
+            pass  # the bot dropped the download
+        return resp
+
+    app = web.Application()
+    app.router.add_route("HEAD", "/f/{name}", head)
+    app.router.add_route("GET", "/f/{name}", get)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+class Stats:
+    def __init__(self, flood_burst, flood_rate, sleep_threshold):
+        self.flood_burst = flood_burst
+        self.flood_rate = flood_rate
+        self.sleep_threshold = sleep_threshold
+        self.buckets = {}
+        self.edits = []          # (time, chat_id, message_id, text)
+        self.replies = []        # (chat_id, text)
+        self.flood_waits = 0     # raised into the handler
+        self.flood_sleeps = 0    # absorbed by the client, as pyrogram does
+        self.uploads = []        # (chat_id, file_name, bytes_read)
+        self.upload_started = {} # chat_id -> time
+        self.peak_files = 0
+        self.peak_sockets = 0
+
+    # Per-chat token bucket; returns the seconds Telegram would ask us to wait (0 = sent)
+    def _reserve(self, chat_id):
+        now = time.monotonic()
+        tokens, last = self.buckets.get(chat_id, (self.flood_burst, now))
+        tokens = min(self.flood_burst, tokens + (now - last) * self.flood_rate)
+        if tokens < 1:
+            self.buckets[chat_id] = (tokens, now)
+            return math.ceil((1 - tokens) / self.flood_rate)
+        self.buckets[chat_id] = (tokens - 1, now)
+        return 0
+
+    # Like Client.invoke: sleep through short FloodWaits and retry, raise longer ones
+    async def take(self, chat_id):
+        if self.flood_rate <= 0:
+            return
+        from pyrogram.errors import FloodWait
+        while True:
+            wait = self._reserve(chat_id)
+            if not wait:
+                return
+            if wait > self.sleep_threshold >= 0:
+                self.flood_waits += 1
+                raise FloodWait(value=wait)
+            self.flood_sleeps += 1
+            await asyncio.sleep(wait)
+
+
+def make_fakes(stats, rate):
+    from pyrogram.enums import ChatType
+    from pyrogram.types import Chat, Message, User
+
+    ids = iter(range(1, 1 << 30))
+
+    class FakeMessage(Message):
+        def __init__(self, **kwargs):
+            super().__init__(id=next(ids), **kwargs)
+
+        async def reply(self, text, **kwargs):
+            await stats.take(self.chat.id)
+            stats.replies.append((self.chat.id, text))
+            return FakeMessage(chat=self.chat, text=text)
+
+        async def edit_text(self, text, **kwargs):
+            await stats.take(self.chat.id)
+            self.text = text
+            stats.edits.append((time.monotonic(), self.chat.id, self.id, text))
+            return self
+
+    class FakeClient:
+        def __init__(self):
+            self.me = User(id=0, first_name="RvX", username="rvx_loadtest_bot", is_bot=True)
+            self.loop = asyncio.get_running_loop()
+            self.executor = None
+
+        async def _send(self, chat_id, path, caption=None, progress=None, **kwargs):
+            stats.upload_started.setdefault(chat_id, time.monotonic())
+            total = os.path.getsize(path)
+            read = 0
+            with open(path, "rb") as f:
+                while True:
+                    chunk = f.read(CHUNK * 8)
+                    if not chunk:
+                        break
+                    read += len(chunk)
+                    await asyncio.sleep(len(chunk) / rate)
+                    if progress:
+                        await progress(read, total)
+            stats.uploads.append((chat_id, caption, read))
+            return FakeMessage(chat=Chat(id=chat_id, type=ChatType.PRIVATE), caption=caption)
+
+        send_document = send_video = send_audio = send_photo = _send
+
+    def user_message(uid, text):
+        chat = Chat(id=uid, type=ChatType.PRIVATE)
+        return FakeMessage(chat=chat, from_user=User(id=uid, first_name=f"user{uid}"), text=text)
+
+    return FakeClient, user_message
+
+
+# Import every plugin module and collect its handlers by group, as pyrogram does
+def load_plugins():
+    from pyrogram.handlers.handler import Handler
+
+    groups = defaultdict(list)
+    for path in sorted((REPO / "plugins").glob("*.py")):
+        module = import_module("plugins." + path.stem)
+        for obj in vars(module).values():
+            if not callable(obj) or not isinstance(getattr(obj, "handlers", None), list):
+                continue
+            for handler, group in obj.handlers:
+                if isinstance(handler, Handler) and isinstance(group, int):
+                    groups[group].append(handler)
+    return [groups[g] for g in sorted(groups)]
+
+
+async def dispatch(groups, client, message):
+    for handlers in groups:
+        for handler in handlers:
+            if await handler.check(client, message):
+                await handler.callback(client, message)
+                break
+
+
+async def monitor(stats, stop):
+    import psutil
+    proc = psutil.Process()
+    while not stop.is_set():
+        stats.peak_files = max(stats.peak_files, len(proc.open_files()))
+        stats.peak_sockets = max(stats.peak_sockets, len(proc.net_connections(kind="tcp")))
+        await asyncio.sleep(0.05)
+
+
+async def run(args):
+    import psutil
+    from pyrogram import Client
+    from pyrogram.session import Session
+    import globals
+    import plugins.authers as authers
+    from Func.downloader import dldir
+
+    sleep_threshold = Session.SLEEP_THRESHOLD if args.sleep_threshold is None else args.sleep_threshold
+    stats = Stats(args.flood_burst, args.flood_rate, sleep_threshold)
+    FakeClient, user_message = make_fakes(stats, args.rate)
+    groups = load_plugins()
+    client = FakeClient()
+
+    # Counted before the origin listens, since cleanup() closes its socket again
+    proc = psutil.Process()
+    base_sockets = len(proc.net_connections(kind="tcp"))
+    origin, base = await start_origin(args.size, args.rate)
+    workers = asyncio.Semaphore(args.workers or Client.WORKERS)
+    rnd = random.Random(args.seed)
+    jobs = {}
+    auth_errors = []
+    stale_auth = []
+
+    # After every auth change the users still mid-job must stay authorized.
+    # Nothing reads globals.AuthU at runtime, so a stale copy is only reported once.
+    def check_auth(op):
+        if not stale_auth and set(authers.AuthU.split(",")) != set(globals.AuthU.split(",")):
+            stale_auth.append(f"globals.AuthU={globals.AuthU!r} went stale after {op} (plugins.authers.AuthU={authers.AuthU!r})")
+        lost = [uid for uid, job in jobs.items() if "latency" not in job and not authers.is_authorized(uid)]
+        if lost:
+            auth_errors.append(f"after {op}: in-flight users {lost} are no longer authorized")
+
+    async def owner(k):
+        uid = 5000 + k
+        await asyncio.sleep(rnd.uniform(0, args.ramp + 2 * args.size / args.rate))
+        for cmd in ("addauth", "removeauth"):
+            op = f"/{cmd} {uid}"
+            async with workers:
+                try:
+                    await dispatch(groups, client, user_message(OWNER_ID, op))
+                except Exception as e:
+                    auth_errors.append(f"{op}: handler raised {type(e).__name__}: {e}")
+            check_auth(op)
+            await asyncio.sleep(rnd.uniform(0, 0.5))
+
+    async def user(i):
+        uid = 1000 + i
+        name = f"job-{i:04d}.bin"
+        await asyncio.sleep(rnd.uniform(0, args.ramp))
+        message = user_message(uid, f"{base}/f/{name}")
+        start = time.monotonic()
+        job = jobs[uid] = {"name": name, "error": None, "start": start}
+        async with workers:
+            try:
+                await dispatch(groups, client, message)
+            except Exception as e:
+                job["error"] = f"{type(e).__name__}: {e}"
+        job["latency"] = time.monotonic() - start
+
+    stop = asyncio.Event()
+    mon = asyncio.create_task(monitor(stats, stop))
+    t0 = time.monotonic()
+    auth_ops = args.users if args.auth_ops is None else args.auth_ops
+    await asyncio.gather(*(user(i) for i in range(args.users)), *(owner(k) for k in range(auth_ops)))
+    wall = time.monotonic() - t0
+    stop.set()
+    await mon
+    await origin.cleanup()
+    await asyncio.sleep(0.1)
+    leaked_sockets = len(proc.net_connections(kind="tcp")) - base_sockets
+
+    return report(args, stats, jobs, wall, sorted(os.listdir(dldir)), leaked_sockets, auth_errors, stale_auth)
+
+
+def report(args, stats, jobs, wall, orphans, leaked_sockets, auth_errors, stale_auth):
+    latencies = [j["latency"] for j in jobs.values()]
+    by_chat = defaultdict(list)
+    for _, chat_id, _, text in stats.edits:
+        by_chat[chat_id].append(text)
+    uploads = {chat_id: (caption, read) for chat_id, caption, read in stats.uploads}
+
+    failures = []
+    no_progress = 0
+    for uid, job in sorted(jobs.items()):
+        name, texts = job["name"], by_chat[uid]
+        download_time = stats.upload_started.get(uid, job["start"] + job["latency"]) - job["start"]
+        if job["error"]:
+            failures.append(f"{name}: handler raised {job['error']}")
+        foreign = {m for t in texts for m in JOB_RE.findall(t)} - {name[:-4]}
+        if foreign:
+            failures.append(f"{name}: progress for {sorted(foreign)} was written to this job's message")
+        if not texts or "Upload Complete" not in texts[-1]:
+            failures.append(f"{name}: last status was {texts[-1][:60] if texts else None!r}")
+        if uid not in uploads:
+            failures.append(f"{name}: nothing was uploaded")
+        elif uploads[uid] != (name, args.size):
+            failures.append(f"{name}: uploaded {uploads[uid]} instead of {(name, args.size)}")
+        if not any(t.startswith("**Downloading...**") for t in texts):
+            no_progress += 1
+            if download_time > args.progress_window:
+                failures.append(f"{name}: no download progress edit in {download_time:.1f}s of downloading")
+    if orphans:
+        failures.append(f"orphaned files in downloads/: {orphans}")
+    if leaked_sockets > 0:
+        failures.append(f"{leaked_sockets} TCP socket(s) still open after the run")
+    failures += auth_errors
+    refused = [text for chat_id, text in stats.replies if chat_id == OWNER_ID and not text.startswith("✅")]
+    if refused:
+        failures.append(f"owner auth commands were refused: {refused[:3]}")
+
+    per_msg = defaultdict(int)
+    for _, _, msg_id, _ in stats.edits:
+        per_msg[msg_id] += 1
+
+    print(f"users={args.users} size={args.size} rate={args.rate}/s wall={wall:.2f}s")
+    print("latency  p50={:.2f}s p90={:.2f}s p99={:.2f}s max={:.2f}s".format(
+        percentile(latencies, 50), percentile(latencies, 90), percentile(latencies, 99), max(latencies, default=0)))
+    print(f"edits    total={len(stats.edits)} rate={len(stats.edits) / wall:.2f}/s "
+          f"max_per_message={max(per_msg.values(), default=0)} replies={len(stats.replies)}")
+    print(f"flood    slept={stats.flood_sleeps} raised={stats.flood_waits} (sleep_threshold={stats.sleep_threshold}s)")
+    print(f"peak     open_files={stats.peak_files} tcp_sockets={stats.peak_sockets}")
+    print(f"progress jobs_without_download_progress={no_progress}/{args.users}")
+    if stale_auth:
+        print(f"auth     {stale_auth[0]}")
+    if failures:
+        print(f"FAILED   {len(failures)} check(s):")
+        for f in failures:
+            print(f"  - {f}")
+        return 1
+    print("OK       all checks passed")
+    return 0
+
+
+def main():
+    args = parse_args()
+    # Run in a scratch dir so downloads/ and the log file don't touch the repo
+    workdir = tempfile.mkdtemp(prefix="rvx-loadtest-")
+    os.chdir(workdir)
+    sys.path.insert(0, str(REPO))
+    os.environ["auth"] = ",".join(str(1000 + i) for i in range(args.users))
+    os.environ["owner"] = str(OWNER_ID)
+    os.environ["logfile"] = os.path.join(workdir, "loadtest.log")
+
+    import logging
+    import log
+    if not args.verbose:
+        log.console_handler.setLevel(logging.WARNING)
+
+    print(f"workdir  {workdir}")
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
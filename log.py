@@ -1,23 +1,58 @@
+import atexit
 import logging
+import queue
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from config import Config
 logging.getLogger("pyrogram").setLevel(logging.WARNING)
 
+# Keeps the last N formatted records in memory (served by /logs)
+class RingBufferHandler(logging.Handler):
+    def __init__(self, capacity):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+
+    def emit(self, record):
+        try:
+            self.records.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+    def tail(self, n=None):
+        records = list(self.records)
+        return records if n is None else records[-n:] if n > 0 else []
+
 # Set up a custom logger for your application
 logger = logging.getLogger("RvX")
-logger.setLevel(logging.INFO)
+logger.setLevel(Config.LOG_LEVEL)
+logger.propagate = False
 
-# Create a file handler to log messages to a file
-file_handler = logging.FileHandler("login_activity.log")
-file_handler.setLevel(logging.INFO)
+# Create a rotating file handler so the log file can't grow forever
+file_handler = RotatingFileHandler(Config.LOG_FILE, maxBytes=Config.LOG_MAX_BYTES, backupCount=Config.LOG_BACKUPS)
+file_handler.setLevel(Config.LOG_LEVEL)
 
 # Create a console handler to log messages to the console (optional)
 console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.INFO)
+console_handler.setLevel(Config.LOG_LEVEL)
+
+# In-memory ring of recent records
+ring_handler = RingBufferHandler(Config.LOG_RING_SIZE)
+ring_handler.setLevel(Config.LOG_LEVEL)
 
 # Create a logging format
 formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 file_handler.setFormatter(formatter)
 console_handler.setFormatter(formatter)
+ring_handler.setFormatter(formatter)
+
+# The event loop only enqueues records; a background thread does the I/O
+log_queue = queue.SimpleQueue()
+listener = QueueListener(log_queue, file_handler, console_handler, ring_handler, respect_handler_level=True)
+listener.start()
+atexit.register(listener.stop)
+
+logger.addHandler(QueueHandler(log_queue))
 
-# Add handlers to the custom logger
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+# Return the last n log lines
+def recent_logs(n=None):
+    return ring_handler.tail(n)
@@ -0,0 +1,37 @@
+import html
+from pyrogram import Client, filters
+from pyrogram.enums import ParseMode
+from pyrogram.types import Message
+from config import Config
+from log import recent_logs
+
+OWNER = Config.OWNER
+# Telegram rejects messages longer than 4096 characters
+MAX_LEN = 4000
+
+# Command to fetch the most recent log lines from memory
+@Client.on_message(filters.command("logs"))
+async def get_logs(client, message: Message):
+    if str(message.from_user.id) not in OWNER.split(","):
+        await message.reply("❌ You are not authorized to view the logs!")
+        return
+
+    args = message.text.split(" ", 1)
+    n = 20
+    if len(args) > 1:
+        if not args[1].strip().isdecimal() or int(args[1]) < 1:
+            await message.reply("⚠️ Usage: `/logs [count]` (count >= 1)")
+            return
+        n = min(int(args[1]), Config.LOG_RING_SIZE)
+
+    lines = recent_logs(n)
+    if not lines:
+        await message.reply("No logs recorded yet.")
+        return
+
+    # Escape so tags in log lines survive, then drop the oldest lines until it fits
+    lines = [html.escape(line) for line in lines]
+    while len(lines) > 1 and len("\n".join(lines)) > MAX_LEN:
+        lines.pop(0)
+    text = "\n".join(lines)[-MAX_LEN:]
+    await message.reply(f"<b>📜 Recent Logs:</b>\n\n<pre>{text}</pre>", parse_mode=ParseMode.HTML)
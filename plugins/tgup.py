@@ -1,7 +1,6 @@
 import os
 import time
 import asyncio
-import ffmpeg
 from pyrogram.types import InputMediaVideo, InputMediaAudio
 from pyrogram.errors import FloodWait
 from humanize import naturalsize
@@ -9,6 +8,8 @@ from log import logger as lg
 
 # Function to get media duration and generate a thumbnail if needed
 def get_media_info(file_path, thumb_path=None):
+    # Imported on first use to keep bot start-up light
+    import ffmpeg
     try:
         probe = ffmpeg.probe(file_path)
         duration = int(float(probe["format"]["duration"])) if "duration" in probe["format"] else 0
@@ -21,7 +22,7 @@ def get_media_info(file_path, thumb_path=None):
             )
         return duration, thumb_path
     except Exception as e:
-        print(f"FFmpeg Error: {e}")
+        lg.error(f"FFmpeg Error: {e}")
         return 0, None
 
 # Function to upload file with progress updates
@@ -96,7 +97,6 @@ async def upload_file(client, chat_id, file_path, msg, as_document=False, thumb=
             if thumb and os.path.exists(thumb):
                 os.remove(thumb)
         except Exception as e:
-            print(f"File Deletion Error: {e}")
-            lg.info(f"File Deletion Error: {e}")
+            lg.warning(f"File Deletion Error: {e}")
             return
       
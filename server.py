@@ -0,0 +1,85 @@
+import os
+import time
+import psutil
+from aiohttp import web
+from log import logger as lg
+
+# Health / metrics / status server that runs on the bot's own event loop
+proc = psutil.Process(os.getpid())
+startup = {}
+
+# Current resident memory of this process in bytes
+def rss():
+    return proc.memory_info().rss
+
+# Seconds since the interpreter was launched
+def uptime():
+    return time.time() - proc.create_time()
+
+def open_fds():
+    try:
+        return proc.num_fds()
+    except (AttributeError, psutil.Error):
+        return len(proc.open_files())
+
+# Record a startup phase duration (seconds) and log the full report once ready
+def mark(phase, seconds):
+    startup[phase] = round(seconds, 3)
+
+def report_startup():
+    startup["total"] = round(uptime(), 3)
+    startup["rss"] = rss()
+    lg.info(
+        "Startup: "
+        + ", ".join(f"{k}={v}s" for k, v in startup.items() if k != "rss")
+        + f", rss={startup['rss'] // (1024 * 1024)}MiB"
+    )
+    return startup
+
+async def hello_world(request):
+    return web.Response(text="Hello from Koyeb")
+
+async def health(request):
+    return web.json_response({"status": "ok"})
+
+async def status(request):
+    return web.json_response({
+        "uptime": round(uptime(), 3),
+        "rss": rss(),
+        "open_fds": open_fds(),
+        "threads": proc.num_threads(),
+        "startup": startup,
+    })
+
+# Prometheus text exposition format
+async def metrics(request):
+    lines = [
+        "# TYPE rvx_uptime_seconds gauge",
+        f"rvx_uptime_seconds {uptime():.3f}",
+        "# TYPE rvx_resident_memory_bytes gauge",
+        f"rvx_resident_memory_bytes {rss()}",
+        "# TYPE rvx_open_fds gauge",
+        f"rvx_open_fds {open_fds()}",
+        "# TYPE rvx_threads gauge",
+        f"rvx_threads {proc.num_threads()}",
+        "# TYPE rvx_startup_seconds gauge",
+    ]
+    lines += [f'rvx_startup_seconds{{phase="{k}"}} {v}' for k, v in startup.items() if k != "rss"]
+    return web.Response(text="\n".join(lines) + "\n", content_type="text/plain")
+
+def make_app():
+    app = web.Application()
+    app.router.add_get("/", hello_world)
+    app.router.add_get("/health", health)
+    app.router.add_get("/status", status)
+    app.router.add_get("/metrics", metrics)
+    return app
+
+# Start serving on the running loop; returns the runner so the caller can clean up
+async def start_server(host="0.0.0.0", port=8000):
+    runner = web.AppRunner(make_app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    lg.info(f"HTTP server listening on {host}:{port}")
+    return runner